@@ -1,4 +1,11 @@
 import yaml
+import os
+import sys
+import re
+import functools
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import copy
 from pathlib import Path
 from importlib import resources
 import pandas as pd
@@ -9,6 +16,291 @@ from . import loaders
 # Ensure UserWarnings are always shown
 warnings.simplefilter('always', UserWarning)
 
+# Use the libyaml-backed loader when available, falling back to the pure-Python loader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Common loader parameters extracted from a dataset row by DataCatalog._extract_row_params.
+# A named tuple, so loaders can either unpack it or access fields by name.
+_RowParams = namedtuple("_RowParams", (
+    "path",
+    "ext",
+    "skip_lines",
+    "no_data",
+    "ignore_dirs",
+    "ignore_files",
+    "loader",
+    "resolutions",
+    "static_patterns",
+))
+
+@functools.lru_cache(maxsize = 256)
+def _list_subdirectories(path, mtime_ns):
+    """
+    List the subdirectory names of a directory, memoized per directory state.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        Path to the directory.
+    mtime_ns : :class:`int`
+        Modification time of the directory in nanoseconds. Only used as part of the
+        cache key, so that adding, removing or renaming entries invalidates the cache.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`str`
+        Sorted subdirectory names.
+    """
+
+    # os.scandir exposes the entry type from the directory read, avoiding a stat per entry
+    with os.scandir(path) as entries:
+        return tuple(sorted(entry.name for entry in entries if entry.is_dir()))
+
+def _ignore_matcher(patterns):
+    """
+    Build a function that searches a path for any of the given substrings.
+
+    Paths are matched in POSIX form (``/`` separators), as with
+    :meth:`pathlib.Path.as_posix`, so patterns written with ``/`` in the YAML
+    configuration also match on Windows.
+
+    Parameters
+    ----------
+    patterns : :class:`tuple` of :class:`str`
+        Path substrings to search for.
+
+    Returns
+    -------
+    callable
+        Function taking a path :class:`str` and returning a match object or ``None``.
+    """
+
+    search = re.compile("|".join(map(re.escape, patterns))).search
+
+    # Native paths already use POSIX separators on this platform
+    if os.sep == "/":
+        return search
+
+    sep = os.sep
+    return lambda path: search(path.replace(sep, "/"))
+
+def _walk_files(root, suffix, ignore_dirs = (), ignore_files = (), match_dirs = False, visited = None):
+    """
+    Recursively yield paths of files under a directory whose names end with a suffix.
+
+    The tree is walked with :func:`os.scandir`, which returns the entry type with the
+    directory listing, so no extra ``stat`` call is needed per entry. As with
+    :meth:`pathlib.Path.rglob`, symlinked directories are not descended into and
+    unreadable or missing directories are skipped.
+
+    Parameters
+    ----------
+    root : :class:`str`
+        Root directory to search.
+    suffix : :class:`str`
+        File name suffix to match (e.g. ``'.nc'``).
+    ignore_dirs : :class:`tuple` of :class:`str`, optional
+        Path substrings to ignore, matched against the POSIX form of each path.
+        Files whose path contains any of them are skipped.
+        Directories whose path contains any of them are pruned without being walked,
+        as every file below them would be skipped anyway. Default is ``()``.
+    ignore_files : :class:`tuple` of :class:`str`, optional
+        Further path substrings to ignore for files only. Default is ``()``.
+    match_dirs : :class:`bool`, optional
+        If True, directories whose names end with ``suffix`` are yielded (and not
+        descended into) like files, e.g. for ``'.zarr'`` stores. Default is ``False``.
+    visited : :class:`list`, optional
+        If given, a ``(directory, mtime_ns)`` pair is appended for every directory
+        walked, with ``mtime_ns`` set to ``None`` if the directory cannot be read.
+
+    Yields
+    ------
+    :class:`str`
+        Path of each matching file.
+    """
+
+    # Match all ignore substrings with a single compiled alternation per path. Files
+    # are checked against both lists at once, directories against ignore_dirs only.
+    ignored = _ignore_matcher(ignore_dirs) if ignore_dirs else None
+    ignored_file = ignored
+    if ignore_files:
+        ignored_file = _ignore_matcher(ignore_dirs + ignore_files)
+
+    if ignored is not None and ignored(root):
+        return
+
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+
+        # Record the directory state before listing it, so any later change is detected
+        if visited is not None:
+            visited.append((directory, _mtime_ns(directory)))
+
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        with entries:
+            for entry in entries:
+                path = entry.path
+                if entry.is_dir(follow_symlinks = False):
+                    if match_dirs and entry.name.endswith(suffix):
+                        if ignored_file is None or not ignored_file(path):
+                            yield path
+                    elif ignored is None or not ignored(path):
+                        stack.append(path)
+                elif entry.name.endswith(suffix) and (ignored_file is None or not ignored_file(path)):
+                    yield path
+
+def _mtime_ns(path):
+    """
+    Modification time of a path in nanoseconds, or ``None`` if it cannot be read.
+    """
+
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+# File lists found by _find_files, keyed by the walk arguments. Each entry stores the
+# (directory, mtime_ns) pairs of every directory walked alongside the sorted paths.
+_FILE_LISTS = {}
+_FILE_LISTS_MAXSIZE = 128
+
+def _find_files(root, suffix, ignore_dirs, ignore_files, match_dirs):
+    """
+    Sorted paths of the files found by :func:`_walk_files`, memoized per directory tree state.
+
+    A cached result is reused only while every directory walked to produce it still has
+    the same modification time, so files added, removed or renamed anywhere in the tree
+    trigger a fresh walk. Re-checking costs one ``stat`` per directory rather than a
+    full directory listing.
+
+    Parameters
+    ----------
+    root : :class:`str`
+        Root directory to search.
+    suffix : :class:`str`
+        File name suffix to match (e.g. ``'.nc'``).
+    ignore_dirs : :class:`tuple` of :class:`str`
+        Path substrings to ignore for directories and files.
+    ignore_files : :class:`tuple` of :class:`str`
+        Path substrings to ignore for files only.
+    match_dirs : :class:`bool`
+        Whether directories ending with ``suffix`` are matched as well.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`pathlib.Path`
+        Sorted matching file paths.
+    """
+
+    key = (root, suffix, ignore_dirs, ignore_files, match_dirs)
+
+    # Reuse the previous walk if none of the walked directories have changed
+    cached = _FILE_LISTS.get(key)
+    if cached is not None:
+        visited, paths = cached
+        if all(_mtime_ns(directory) == mtime_ns for directory, mtime_ns in visited):
+            return paths
+
+    visited = []
+    paths = tuple(sorted(Path(p) for p in _walk_files(root, suffix,
+                                                      ignore_dirs = ignore_dirs,
+                                                      ignore_files = ignore_files,
+                                                      match_dirs = match_dirs,
+                                                      visited = visited)))
+
+    # Store the result, evicting the oldest entry once the cache is full
+    _FILE_LISTS.pop(key, None)
+    if len(_FILE_LISTS) >= _FILE_LISTS_MAXSIZE:
+        _FILE_LISTS.pop(next(iter(_FILE_LISTS)), None)
+    _FILE_LISTS[key] = (tuple(visited), paths)
+
+    return paths
+
+@functools.lru_cache(maxsize = 32)
+def _read_yaml_config(path, mtime_ns, size):
+    """
+    Parse a YAML configuration file, memoized per file state.
+
+    The file is parsed with the libyaml-backed ``CSafeLoader`` when available (falling
+    back to ``SafeLoader``), and the result is only cached in memory for this process.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        Absolute path to the YAML file.
+    mtime_ns : :class:`int`
+        Modification time of the YAML file in nanoseconds. Only used as part of the
+        cache key, so that edits to the file invalidate the cache.
+    size : :class:`int`
+        Size of the YAML file in bytes. Only used as part of the cache key.
+
+    Returns
+    -------
+    dict
+        Parsed YAML content. Shared between callers and must not be modified.
+    """
+
+    # Read bytes: the loader detects the encoding itself, skipping Python's text decoding layer
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader = _YamlLoader)
+
+def _default_config_path():
+    """
+    Path to the default packaged catalog configuration file.
+
+    Returns
+    -------
+    :class:`pathlib.Path`
+        Path to ``config/datasets.yaml`` in the installed package.
+    """
+
+    with resources.as_file(
+        resources.files("datapool").joinpath("config/datasets.yaml")
+    ) as p:
+        return Path(p)
+
+@functools.lru_cache(maxsize = None)
+def _resolve_loader(name):
+    """
+    Look up a loader function by name in the loaders module, memoized per name.
+
+    The memo is process-wide, so a loader replaced at runtime (e.g. with
+    ``monkeypatch.setattr(loaders, ...)`` or ``importlib.reload(loaders)``) is only
+    picked up after :meth:`DataCatalog.clear_cache` is called.
+
+    Parameters
+    ----------
+    name : :class:`str`
+        Name of the loader function.
+
+    Returns
+    -------
+    callable
+        The loader function.
+
+    Raises
+    ------
+    ValueError
+        If the loader function does not exist in the loaders module or is not callable.
+    """
+
+    try:
+        loader = getattr(loaders, name)
+    except AttributeError:
+        raise ValueError(f"Loader '{name}' not found in loaders module.")
+
+    if not callable(loader):
+        raise ValueError(f"Loader '{name}' exists but is not callable.")
+
+    return loader
+
 class DataCatalog:
     """
     A catalog for managing and loading datasets with versioning and subdataset support.
@@ -24,11 +316,27 @@ class DataCatalog:
         Parsed YAML configuration content.
     datasets : :class:`pandas.DataFrame`
         DataFrame listing all datasets, versions, and subdatasets with their metadata.
+        Built from the configuration on first access, which is when the dataset
+        directories are scanned.
     _df_summary : :class:`pandas.DataFrame`
         Subset or summary of the datasets DataFrame, used for display purposes
         (e.g., in `_repr_html_`). This may reflect filtered search results
-        or the full catalog if no filtering has been applied. By default, it returns
-        :class:`self.datasets`.
+        or the full catalog if no filtering has been applied. By default (``None``),
+        :class:`self.datasets` is displayed.
+
+    Raises
+    ------
+    FileNotFoundError
+        On construction, if the provided ``yaml_path`` does not exist.
+    ValueError
+        On construction, if the configuration is malformed (no ``datasets`` mapping,
+        a dataset entry that is not a mapping with a ``path``, or ``subdatasets`` that
+        is not a mapping of versions to mappings).
+    ValueError
+        On first access to :attr:`datasets`, if a configured version directory does
+        not exist or a required ``subpath``/``extension`` is missing. As the table is
+        built lazily, these errors surface from whichever call first needs it, e.g.
+        :meth:`load_dataset`, :meth:`search`, :meth:`help` or the notebook display.
     
     Examples
     --------
@@ -43,6 +351,58 @@ class DataCatalog:
     >>> filtered_catalog
     """
 
+    # Columns of the datasets DataFrame, in display order
+    _COLUMNS = (
+        "dataset",
+        "display_name",
+        "description",
+        "tags",
+        "version",
+        "subdataset",
+        "path",
+        "full_path",
+        "extension",
+        "skip_lines",
+        "no_data_value",
+        "ignore_dirs",
+        "ignore_files",
+        "loader",
+        "resolutions",
+        "static_patterns",
+    )
+
+    # Keywords understood by the catalog itself (validated by _check_keywords)
+    _CATALOG_KEYWORDS = frozenset({
+        "resolution",
+        "static",
+        "subdataset",
+    })
+
+    # String columns with few distinct values repeated across rows
+    _INTERNED_COLUMNS = frozenset({
+        "dataset",
+        "display_name",
+        "description",
+        "version",
+        "subdataset",
+        "path",
+        "extension",
+        "loader",
+    })
+
+    # Per-row metadata keys resolved by _resolve_all, with their defaults
+    _METADATA_DEFAULTS = (
+        ("subpath", None),
+        ("extension", None),
+        ("skip_lines", 0),
+        ("no_data_value", None),
+        ("ignore_dirs", None),
+        ("ignore_files", None),
+        ("loader", "default"),
+        ("resolutions", None),
+        ("static_patterns", None),
+    )
+
     # Initialize DataPool with key fields
     def __init__(self, yaml_path = None):
         """
@@ -61,18 +421,20 @@ class DataCatalog:
         ------
         FileNotFoundError
             If the provided ``yaml_path`` does not exist.
+        ValueError
+            If the configuration is malformed (see :meth:`_validate_config`).
 
         Notes
         -----
         The YAML file should contain a ``datasets`` key with dataset configurations.
+        The dataset directories are not scanned here: the :attr:`datasets` table is
+        built on first access, so errors from scanning (e.g. a missing version
+        directory) are raised then rather than by the constructor.
         """
 
         # If yaml_path is not specified, use to default ../config/datasets.yaml
         if yaml_path is None:
-            with resources.as_file(
-                resources.files("datapool").joinpath("config/datasets.yaml")
-            ) as p:
-                self.config_file = Path(p)
+            self.config_file = _default_config_path()
         else:
             self.config_file = Path(yaml_path)
             if not self.config_file.exists():
@@ -83,8 +445,164 @@ class DataCatalog:
                     f"default packaged catalog."
                 )
         self.config = self._load_yaml(self.config_file)
-        self.datasets = self._list_datasets()
-        self._df_summary = self.datasets
+        self._validate_config(self.config)
+
+        # The datasets table is built on first access (see the datasets property)
+        self.datasets = None
+        self._df_summary = None
+
+    @property
+    def datasets(self):
+        """
+        :class:`pandas.DataFrame` listing all datasets, versions, and subdatasets with their metadata.
+
+        The table is built from the configuration on first access, so constructing a
+        catalog does not scan the dataset directories until they are needed.
+
+        Raises
+        ------
+        ValueError
+            On first access, if a configured version directory does not exist or a
+            required ``subpath``/``extension`` is missing from the configuration.
+        """
+
+        if self._datasets is None:
+            self.datasets = self._list_datasets()
+
+        return self._datasets
+
+    @datasets.setter
+    def datasets(self, value):
+        self._datasets = value
+
+        # Reset lookups derived from the previous DataFrame, remembering the index they
+        # will be built from so in-place changes to the rows can be detected
+        self._indexed_on = None if value is None else value.index
+        self._search_haystack = None
+        self._row_index = None
+        self._subdataset_index = None
+        self._subdatasets_by_version = None
+        self._versions_by_dataset = None
+        self._latest_versions = None
+
+    def _check_lookups(self):
+        """
+        Return :attr:`datasets`, first discarding derived lookups if its rows have changed.
+
+        The lookups (row and subdataset indexes, version maps, search text) refer to rows
+        by position. In-place changes to the rows of :attr:`datasets` (e.g. ``drop``,
+        ``sort_values`` or ``query`` with ``inplace = True``) replace the DataFrame's
+        index, in which case the lookups are rebuilt on next use. Editing values of
+        existing rows in place is not detected; assign a new DataFrame instead.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            The datasets table.
+        """
+
+        df = self.datasets
+        if df.index is not self._indexed_on:
+            self.datasets = df
+
+        return df
+
+    def _get_row_index(self):
+        """
+        Return a mapping of ``(dataset, version)`` to row positions in :attr:`datasets`.
+
+        The mapping is built once per catalog on first use, so looking up the rows of
+        a dataset/version is a dictionary lookup rather than a boolean mask scan
+        over the whole DataFrame.
+
+        Returns
+        -------
+        :class:`dict`
+            Mapping of ``(dataset, version)`` tuples to :class:`list` of :class:`int`
+            row positions.
+        """
+
+        df = self._check_lookups()
+
+        if self._row_index is None:
+            row_index = {}
+            for position, key in enumerate(zip(df["dataset"], df["version"])):
+                row_index.setdefault(key, []).append(position)
+            self._row_index = row_index
+
+        return self._row_index
+
+    def _get_subdataset_index(self):
+        """
+        Return a mapping of ``(dataset, version, subdataset)`` to row position in :attr:`datasets`.
+
+        Like :meth:`_get_row_index`, the mapping is built once per catalog on first use.
+        Rows without a subdataset are not included.
+
+        Returns
+        -------
+        :class:`dict`
+            Mapping of ``(dataset, version, subdataset)`` tuples to :class:`int` row positions.
+        """
+
+        df = self._check_lookups()
+
+        if self._subdataset_index is None:
+            self._subdataset_index = {
+                (name, version, subdataset): position
+                for position, (name, version, subdataset) in enumerate(zip(df["dataset"], df["version"], df["subdataset"]))
+                if pd.notna(subdataset)
+            }
+
+        return self._subdataset_index
+
+    def _get_subdatasets_by_version(self):
+        """
+        Return a mapping of ``(dataset, version)`` to the subdatasets defined for it.
+
+        Built once per catalog on first use from :meth:`_get_subdataset_index`.
+        Dataset versions without subdatasets are not included.
+
+        Returns
+        -------
+        :class:`dict`
+            Mapping of ``(dataset, version)`` tuples to :class:`list` of subdataset
+            names, in catalog order.
+        """
+
+        self._check_lookups()
+
+        if self._subdatasets_by_version is None:
+            subdatasets_by_version = {}
+            for name, version, subdataset in self._get_subdataset_index():
+                subdatasets_by_version.setdefault((name, version), []).append(subdataset)
+            self._subdatasets_by_version = subdatasets_by_version
+
+        return self._subdatasets_by_version
+
+    def _get_versions_by_dataset(self):
+        """
+        Return a mapping of dataset name to its versions in :attr:`datasets`.
+
+        Built once per catalog on first use from :meth:`_get_row_index`.
+
+        Returns
+        -------
+        :class:`dict`
+            Mapping of dataset names to :class:`tuple` of version names, in catalog order.
+        """
+
+        self._check_lookups()
+
+        if self._versions_by_dataset is None:
+            versions_by_dataset = {}
+            for name, version in self._get_row_index():
+                versions_by_dataset.setdefault(name, []).append(version)
+
+            # Store immutable tuples so the shared index cannot be modified by callers
+            self._versions_by_dataset = {name: tuple(versions) for name, versions in versions_by_dataset.items()}
+
+        return self._versions_by_dataset
     
     def _repr_html_(self):
         """
@@ -115,9 +633,12 @@ class DataCatalog:
         # Title
         title = "ACCESS Cryosphere Data Catalogue"
     
+        # Table to display (the full catalog unless filtered)
+        summary = self._df_summary if self._df_summary is not None else self.datasets
+
         # Number of datasets and rows
-        ndatasets = self._df_summary['dataset'].nunique() if not self._df_summary.empty else 0
-        nrows = len(self._df_summary)
+        ndatasets = summary['dataset'].nunique() if not summary.empty else 0
+        nrows = len(summary)
     
         # Handle empty catalog gracefully
         if nrows == 0:
@@ -133,7 +654,7 @@ class DataCatalog:
             return f"<div>{summary_html}</div>"
     
         # Otherwise, render table
-        table_html = self._df_summary._repr_html_()
+        table_html = summary._repr_html_()
     
         summary_html = f"""
         <div style="margin-bottom: 0.75em;">
@@ -172,10 +693,59 @@ class DataCatalog:
         -------
         dict
             Parsed YAML content as a dictionary.
+
+        Notes
+        -----
+        The parsed configuration is cached in-process, keyed by the YAML file's
+        modification time (ns) and size, so edits are always picked up. Each call
+        returns a fresh copy of the configuration.
+        """
+
+        path = Path(path)
+
+        # Identify the current state of the YAML file and reuse the parse for it.
+        # Return a copy so callers cannot mutate the cached configuration.
+        stat = os.stat(path)
+        config = _read_yaml_config(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+        return copy.deepcopy(config)
+
+    def _validate_config(self, config):
+        """
+        Check the overall structure of a parsed YAML configuration.
+
+        This is a single up-front pass over the configuration so that structural
+        problems are reported with a clear message before any directories are scanned.
+        Per-version requirements (e.g. ``subpath`` and ``extension``, which may be
+        version-specific) are checked while the datasets table is built.
+
+        Parameters
+        ----------
+        config : dict
+            Parsed YAML configuration.
+
+        Raises
+        ------
+        ValueError
+            If the configuration has no ``datasets`` mapping, or a dataset entry is not
+            a mapping with a ``path``, or its ``subdatasets`` is not a mapping of versions
+            to mappings of subdatasets.
         """
 
-        with open(path, "r") as f:
-            return yaml.safe_load(f)
+        if not isinstance(config, dict) or not isinstance(config.get("datasets"), dict):
+            raise ValueError(f"DataCatalog YAML file '{self.config_file}' must define a 'datasets' mapping.")
+
+        for dataset_name, meta in config["datasets"].items():
+            if not isinstance(meta, dict):
+                raise ValueError(f"Configuration for dataset '{dataset_name}' must be a mapping.")
+            if not meta.get("path"):
+                raise ValueError(f"Path must be specified for dataset '{dataset_name}'. This should be defined in the YAML config.")
+
+            if "subdatasets" not in meta:
+                continue
+            subdatasets = meta["subdatasets"]
+            if not isinstance(subdatasets, dict) or not all(isinstance(subds_dict, dict) for subds_dict in subdatasets.values()):
+                raise ValueError(f"Subdatasets for dataset '{dataset_name}' must map versions to subdataset definitions.")
 
     def _infer_versions_from_directory(self, dataset_path):
         """
@@ -192,92 +762,103 @@ class DataCatalog:
             Sorted list of version names (subdirectory names).
         """
 
-        dataset_path = Path(dataset_path)
-        if not dataset_path.exists():
+        # A single stat both checks the directory exists and provides the cache key.
+        # Listings are memoized per (directory, mtime) so unchanged directories are not re-scanned.
+        dataset_path = os.fspath(dataset_path)
+        try:
+            mtime_ns = os.stat(dataset_path).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
-        return sorted([
-            p.name for p in dataset_path.iterdir()
-            if p.is_dir()
-        ])
+        return list(_list_subdirectories(dataset_path, mtime_ns))
 
-    def _resolve_metadata(self, meta, subds_meta, version, key, default=None):
+    @staticmethod
+    def clear_cache():
         """
-        Resolve a metadata value for a dataset, supporting dataset-level and
-        subdataset-level overrides, including optional per-version dictionaries.
+        Clear the process-wide caches of directory listings, parsed configs, loaders and shared catalogs.
+
+        Directory listings and dataset file lists are cached and invalidated automatically
+        when the modification time of any directory they were read from changes. Call this
+        method to force a fresh scan, e.g. after changes that do not update a directory
+        modification time.
+        Catalogs returned by :func:`get_catalog` are also discarded.
+
+        Loader functions are memoized by name. Call this method after replacing a
+        loader at runtime (e.g. monkeypatching or reloading the loaders module) so the
+        new function is used.
+        """
+
+        _list_subdirectories.cache_clear()
+        _FILE_LISTS.clear()
+        _read_yaml_config.cache_clear()
+        _resolve_loader.cache_clear()
+        _get_catalog_cached.cache_clear()
+
+    def _resolve_all(self, meta, subds_meta, version):
+        """
+        Resolve all per-row metadata keys for a dataset/version (and subdataset) at once.
+
+        Every key in :attr:`_METADATA_DEFAULTS` is resolved in a single pass over the
+        metadata dictionaries, so they are only unpacked once per row. List-valued keys
+        are normalised to tuples with :meth:`_normalise_list`.
 
         Resolution priority (highest to lowest):
 
         1. Subdataset-level value (``subds_meta[key]``)
         2. Dataset-level value (``meta[key]``)
-        3. ``default``
+        3. The key's default
 
         If a metadata value is a dictionary and contains a version key
         (e.g., ``{"v1": ..., "v2": ...}``), the value corresponding to the
-        requested version is returned.
+        requested version is used. A subdataset-level dictionary without the version
+        key is used as a whole; a dataset-level one falls back to the default.
 
         Parameters
         ----------
         meta : dict
             Dataset-level metadata dictionary parsed from the YAML configuration.
-        subds_meta : dict
-            Subdataset-level metadata dictionary parsed from the YAML configuration.
+        subds_meta : dict or None
+            Subdataset-level metadata dictionary, or ``None`` for datasets without subdatasets.
         version : str
-            Dataset version identifier (e.g., ``"v1"``, ``"v2"``). Used to resolve
-            version-specific metadata entries when values are dictionaries.
-        key : str
-            Metadata key to resolve (e.g., ``"resolutions"``,
-            ``"static_patterns"``, ``"extension"``).
-        default : Any, optional
-            Value returned if the key is not found at either dataset or
-            subdataset level, or if the key exists but does not define the
-            requested version. Default is ``None``.
+            Dataset version identifier used to resolve version-specific entries.
 
         Returns
         -------
-        Any
-            The resolved metadata value. This may be a scalar (e.g., :class:`str`),
-            a dictionary, or ``None`` if not found and no default is provided.
-
-        Notes
-        -----
-        Subdataset-level metadata always takes precedence over dataset-level
-        metadata. Dictionary-valued metadata may optionally be keyed by version.
-        This method is designed to support flexible YAML layouts where metadata
-        may be specified at different hierarchy levels.
+        :class:`dict`
+            Mapping of each metadata key to its resolved value.
         """
 
-        # Ensure subds_meta is a dict
-        subds_meta = subds_meta or {}
-
-        # Check subdataset-level metadata first (highest priority)
-        subds_value = subds_meta.get(key, None)
-
-        if isinstance(subds_value, dict):
-            # If the value is a dict, attempt to resolve by version.
-            # If no version key is found, return the entire dict.
-            return subds_value.get(version, subds_value)
-        elif subds_value is not None:
-            # Scalar value found at subdataset level
-            return subds_value
-
-        # Fallback to dataset-level metadata
-        ds_value = meta.get(key, None)
-
-        if isinstance(ds_value, dict):
-            # Dataset-level dic may define version-specific entries
-            return ds_value.get(version, default)
-        elif ds_value is not None:
-            # Scalar value found at dataset level
-            return ds_value
-
-        # Nothing found - return default
-        return default
+        resolved = {}
+
+        # Dataset-level value (version entry if a dict), then default
+        for key, default in self._METADATA_DEFAULTS:
+            value = meta.get(key)
+            if isinstance(value, dict):
+                value = value.get(version, default)
+            elif value is None:
+                value = default
+            resolved[key] = value
+
+        # Subdataset-level values take precedence (whole dict if no version key).
+        # Datasets without subdatasets skip this level entirely.
+        if subds_meta:
+            for key in resolved:
+                value = subds_meta.get(key)
+                if isinstance(value, dict):
+                    resolved[key] = value.get(version, value)
+                elif value is not None:
+                    resolved[key] = value
+
+        # Normalise lists as needed
+        for key in ("ignore_dirs", "ignore_files", "static_patterns"):
+            resolved[key] = self._normalise_list(resolved[key])
+
+        return resolved
 
     def _normalise_list(self, value):
         """
-        Ensure the value is a list. If it's a scalar, wrap it in a list.
-        If it's None, return an empty list.
+        Ensure the value is a sequence of items, stored as an immutable tuple.
+        If it's a scalar, wrap it in a tuple. If it's None, return an empty tuple.
 
         Parameters
         ----------
@@ -286,16 +867,23 @@ class DataCatalog:
 
         Returns
         -------
-        list
-            A list containing the input value, or an empty list if input is None.
+        tuple
+            A tuple containing the input value(s), or an empty tuple if input is None.
+
+        Notes
+        -----
+        Tuples are used so that list-like metadata stored in the datasets table is
+        hashable and cannot be modified in place through a loaded row.
         """
 
         if value is None:
-            return []
-        elif isinstance(value, list):
+            return ()
+        elif isinstance(value, tuple):
             return value
+        elif isinstance(value, list):
+            return tuple(value)
         else:
-            return [value]
+            return (value,)
 
     def _list_datasets(self):
         """
@@ -318,20 +906,39 @@ class DataCatalog:
             ``ignore_files``, ``loader``, ``resolutions``, ``static_patterns``.
         """
 
-        # Initialize list to hold dataset records
-        records = []
+        # Initialize one list per column to hold dataset records. Building the
+        # DataFrame column-wise avoids pandas' slow per-row (list-of-dicts) inference.
+        columns = {name: [] for name in self._COLUMNS}
+
+        # Intern strings repeated across many rows (e.g. extensions, loader names), so
+        # each distinct value is stored once rather than once per YAML occurrence
+        def add_record(**record):
+            for name, value in record.items():
+                if name in self._INTERNED_COLUMNS and isinstance(value, str):
+                    value = sys.intern(value)
+                columns[name].append(value)
+
+        # Get dataset versions from directories. Each scan is I/O bound, so scan
+        # all dataset directories concurrently before assembling the records.
+        datasets = self.config["datasets"]
+        with ThreadPoolExecutor(max_workers = min(32, len(datasets) or 1)) as executor:
+            versions_by_dataset = dict(zip(
+                datasets,
+                executor.map(lambda meta: self._infer_versions_from_directory(meta["path"]), datasets.values())
+            ))
 
         # Iterate over datasets in config
-        for dataset_name, meta in self.config["datasets"].items():
+        for dataset_name, meta in datasets.items():
             
             # Extract common metadata
             base_path = Path(meta["path"])
             display_name = meta.get("display_name", dataset_name)
             description = meta.get("description", "")
-            tags = meta.get("tags", [])
+            tags = self._normalise_list(meta.get("tags"))
 
-            # Get dataset versions from directory
-            versions = self._infer_versions_from_directory(base_path)
+            # Get dataset versions from directory (set for membership checks)
+            versions = versions_by_dataset[dataset_name]
+            versions_set = frozenset(versions)
 
             # VERSIONED DATASETS WITH SUBDATASETS
             if "subdatasets" in meta:
@@ -340,56 +947,40 @@ class DataCatalog:
                 for version, subds_dict in meta["subdatasets"].items():
 
                     # Check version exists in directory
-                    if version not in versions:
+                    if version not in versions_set:
                         raise ValueError(f"Version '{version}' for dataset '{dataset_name}' not found in directory '{base_path}'. Available versions: {versions}")
                     
+                    # Construct path to version (shared by its subdatasets)
+                    version_path = base_path / version
+
                     # Iterate over subdatasets
                     for subds_name, subds_meta in subds_dict.items():
                         
                         # Extract subdataset-specific metadata (or dataset-level fallback)
-                        subpath = self._resolve_metadata(meta, subds_meta, version, "subpath")
-                        extension = self._resolve_metadata(meta, subds_meta, version, "extension")
-                        skip_lines = self._resolve_metadata(meta, subds_meta, version, "skip_lines", 0)
-                        no_data_value = self._resolve_metadata(meta, subds_meta, version, "no_data_value", None)
-                        ignore_dirs = self._resolve_metadata(meta, subds_meta, version, "ignore_dirs", None)
-                        ignore_files = self._resolve_metadata(meta, subds_meta, version, "ignore_files", None)
-                        loader = self._resolve_metadata(meta, subds_meta, version, "loader", "default")
-                        resolutions = self._resolve_metadata(meta, subds_meta, version, "resolutions")
-                        static_patterns = self._resolve_metadata(meta, subds_meta, version, "static_patterns", [])
-                        
-                        # Normalise lists as needed
-                        ignore_dirs = self._normalise_list(ignore_dirs)
-                        ignore_files = self._normalise_list(ignore_files)
-                        static_patterns = self._normalise_list(static_patterns)
+                        resolved = self._resolve_all(meta, subds_meta, version)
+                        subpath = resolved.pop("subpath")
 
                         # Error checks
                         if not subpath:
                             raise ValueError(f"Subpath must be specified for subdataset '{subds_name}' in dataset '{dataset_name}', version '{version}'. This should be defined in the YAML config.")
-                        if not extension:
+                        if not resolved["extension"]:
                             raise ValueError(f"Extension must be specified for subdataset '{subds_name}' in dataset '{dataset_name}', version '{version}'. This should be defined in the YAML config.")                       
                         
                         # Construct full path to subdataset
-                        full_path = base_path / version / subpath
+                        full_path = version_path / subpath
 
                         # Append record
-                        records.append({
-                            "dataset": dataset_name,
-                            "display_name": display_name,
-                            "description": description,
-                            "tags": tags,
-                            "version": version,
-                            "subdataset": subds_name,
-                            "path": str(base_path),
-                            "full_path": str(full_path),
-                            "extension": extension,
-                            "skip_lines": skip_lines,
-                            "no_data_value": no_data_value,
-                            "ignore_dirs": ignore_dirs,
-                            "ignore_files": ignore_files,
-                            "loader": loader,
-                            "resolutions": resolutions,
-                            "static_patterns": static_patterns,
-                        })
+                        add_record(
+                            dataset = dataset_name,
+                            display_name = display_name,
+                            description = description,
+                            tags = tags,
+                            version = version,
+                            subdataset = subds_name,
+                            path = str(base_path),
+                            full_path = str(full_path),
+                            **resolved,
+                        )
 
             # VERSIONED DATASETS (no subdatasets)
             else:
@@ -398,48 +989,30 @@ class DataCatalog:
                 for version in versions:
                     
                     # Extract dataset-level metadata (version-specific if applicable)
-                    extension = self._resolve_metadata(meta, None, version, "extension")
-                    skip_lines = self._resolve_metadata(meta, None, version, "skip_lines", 0)
-                    no_data_value = self._resolve_metadata(meta, None, version, "no_data_value", None)
-                    ignore_dirs = self._resolve_metadata(meta, None, version, "ignore_dirs", None)
-                    ignore_files = self._resolve_metadata(meta, None, version, "ignore_files", None)
-                    loader = self._resolve_metadata(meta, None, version, "loader", "default")
-                    resolutions = self._resolve_metadata(meta, None, version, "resolutions")
-                    static_patterns = self._resolve_metadata(meta, None, version, "static_patterns", [])
-
-                    # Normalise lists as needed
-                    ignore_dirs = self._normalise_list(ignore_dirs)
-                    ignore_files = self._normalise_list(ignore_files)
-                    static_patterns = self._normalise_list(static_patterns)
+                    resolved = self._resolve_all(meta, None, version)
+                    del resolved["subpath"]
 
                     # Error check
-                    if not extension:
+                    if not resolved["extension"]:
                         raise ValueError(f"Extension must be specified for dataset '{dataset_name}'. This should be defined in the YAML config.")  
 
                     # Construct path to version
                     version_path = base_path / version
 
                     # Append record
-                    records.append({
-                        "dataset": dataset_name,
-                        "display_name": display_name,
-                        "description": description,
-                        "tags": tags,
-                        "version": version,
-                        "subdataset": None,
-                        "path": str(base_path),
-                        "full_path": str(version_path),
-                        "extension": extension,
-                        "skip_lines": skip_lines,
-                        "no_data_value": no_data_value,
-                        "ignore_dirs": ignore_dirs,
-                        "ignore_files": ignore_files,
-                        "loader": loader,
-                        "resolutions": resolutions,
-                        "static_patterns": static_patterns,
-                    })
-
-        return pd.DataFrame(records)
+                    add_record(
+                        dataset = dataset_name,
+                        display_name = display_name,
+                        description = description,
+                        tags = tags,
+                        version = version,
+                        subdataset = None,
+                        path = str(base_path),
+                        full_path = str(version_path),
+                        **resolved,
+                    )
+
+        return pd.DataFrame(columns)
 
 
     def _recursive_find_files(self, root, extension, ignore_dirs = None, ignore_files = None):
@@ -464,40 +1037,20 @@ class DataCatalog:
             Sorted list of matching file paths.
         """
         
-        # Convert root to Path object
-        root = Path(root)
-        
         # Ensure provided extension does not start with dot
         ext = extension.lstrip(".")
 
-        # Recursively find all files with the given extension
-        files = root.rglob(f"*.{ext}")
-
-        # If ignore_dirs is provided, filter out matching directories
-        if ignore_dirs is None:
-            pass
-        else:
-            # Filter out any path containing one of the ignored directory names
-            filtered = []
-            for f in files:
-                reject = any(bad in f.as_posix() for bad in ignore_dirs)
-                if not reject:
-                    filtered.append(f)
-            files = filtered
-        
-        # If ignore_files is provided, filter out matching file names
-        if ignore_files is None:
-            pass
-        else:
-            filtered = []
-            # Further filter out any files whose names contain one of the ignored file name substrings
-            for f in files:
-                reject = any(bad in f.as_posix() for bad in ignore_files)
-                if not reject:
-                    filtered.append(f)
-            files = filtered
+        # Recursively find all files with the given extension. Ignored directories
+        # are pruned during the walk, so their subtrees are never scanned.
+        # Files matching ignore_files are filtered in the same pass. Zarr stores are
+        # directories, so they are matched as directories rather than files.
+        # Repeated loads reuse the previous walk while no walked directory has changed.
+        paths = _find_files(os.fspath(root), f".{ext}",
+                            tuple(ignore_dirs or ()),
+                            tuple(ignore_files or ()),
+                            ext == "zarr")
 
-        return sorted(files)
+        return list(paths)
 
     def _get_loader(self, name):
         """
@@ -522,15 +1075,8 @@ class DataCatalog:
         if name is None:
             return None
 
-        try:
-            loader = getattr(loaders, name)
-        except AttributeError:
-            raise ValueError(f"Loader '{name}' not found in loaders module.")
-
-        if not callable(loader):
-            raise ValueError(f"Loader '{name}' exists but is not callable.")
-
-        return loader
+        # Resolved loaders are memoized process-wide (reset by clear_cache)
+        return _resolve_loader(name)
 
     def _extract_row_params(self, row):
         """
@@ -543,17 +1089,17 @@ class DataCatalog:
 
         Returns
         -------
-        tuple
-            Tuple containing:
+        :class:`tuple`
+            Named tuple (also accessible by field name) containing:
                 path (Path): Full path to the dataset or subdataset.
                 ext (str): File extension (without leading dot).
                 skip_lines (int): Number of lines to skip when reading files.
                 no_data (Any): Value representing missing data.
-                ignore_dirs (list or None): List of directory substrings to ignore, or None.
-                ignore_files (list or None): List of file substrings to ignore, or None.
+                ignore_dirs (tuple or None): Directory substrings to ignore, or None.
+                ignore_files (tuple or None): File substrings to ignore, or None.
                 loader (str): Name of the loader function.
                 resolutions (Any): Resolution metadata, if available.
-                static_patterns (list): List of static file patterns, if available.
+                static_patterns (tuple): Static file patterns, if available.
         """
     
         # Extract common parameters from row
@@ -567,7 +1113,7 @@ class DataCatalog:
         resolutions = row.get("resolutions")
         static_patterns = row.get("static_patterns", [])
     
-        return path, ext, skip_lines, no_data, ignore_dirs, ignore_files, loader, resolutions, static_patterns
+        return _RowParams(path, ext, skip_lines, no_data, ignore_dirs, ignore_files, loader, resolutions, static_patterns)
 
     def _load_dataset_row(self, row, **kwargs):
         """
@@ -657,40 +1203,39 @@ class DataCatalog:
         if version is None:
             version = self._get_latest_version(dataset)
 
-        # Filter by dataset and version
-        subset = df[(df.dataset == dataset) &
-                    (df.version == version)]
+        # Look up rows for dataset and version
+        positions = self._get_row_index().get((dataset, version))
 
         # Raise error if no matching entry found
-        if subset.empty:
+        if not positions:
             raise KeyError(f"No dataset entry found for:\n"
                             f"'dataset': {dataset}\n"
                             f"'version': {version}")
 
+        # Subdatasets defined for this dataset/version (precomputed per catalog)
+        subdatasets = self._get_subdatasets_by_version().get((dataset, version), [])
 
-        # If subdataset specified, filter by subdataset next
+        # If subdataset specified, look up its row
         if subdataset is not None:
 
             # Check if subdataset exists
-            if subset.subdataset.isna().all():
+            if not subdatasets:
                 raise TypeError(f"'subdataset' is not applicable for dataset '{dataset}'."
                                 " This dataset does not define any subdatasets.")
             
-            # Get available subdatasets
-            available_subdatasets = self.available_subdatasets(dataset, version)
+            # Look up the row for the subdataset
+            position = self._get_subdataset_index().get((dataset, version, subdataset))
 
             # Raise error if specified subdataset not found
-            if subdataset not in available_subdatasets:
+            if position is None:
+                available_subdatasets = self.available_subdatasets(dataset, version)
                 raise KeyError(f"Subdataset '{subdataset}' not found for dataset '{dataset}', version '{version}'.\n"
                                f"Available subdatasets: {available_subdatasets}")
 
-            # Filter by subdataset
-            subset = subset[subset.subdataset == subdataset]
-            
         # Raise error if multiple entries found (should be unique).
-        if len(subset) > 1:
+        elif len(positions) > 1:
             # If multiple subdatasets exist, prompt user to specify one
-            if subset.subdataset.unique().size > 1:
+            if len(subdatasets) > 1:
                 raise ValueError(f"Multiple subdatasets found for dataset '{dataset}', version '{version}'.\n"
                                  f"Available subdatasets: {self.available_subdatasets(dataset, version)}\n"
                                  "Please specify a subdataset to load.")
@@ -698,8 +1243,12 @@ class DataCatalog:
                 # Generic error for multiple matches
                 raise ValueError("Multiple entries matched; dataset table should have unique rows. Refine your query.")
 
+        # Single matching row
+        else:
+            position = positions[0]
+
         # Load dataset from the single matching row
-        row = subset.iloc[0]
+        row = df.iloc[position]
 
         # Check any additional keywords against the row
         self._check_keywords(row, kwargs)
@@ -739,31 +1288,66 @@ class DataCatalog:
         
         # Ensure keywords is a list
         keywords = keyword if isinstance(keyword, list) else [keyword]
+
+        # Get lowercased search text (built once per catalog)
+        haystack = self._get_search_haystack()
         
-        # Initialize boolean mask
-        mask = pd.Series([False] * len(self.datasets))
-        
-        # Update mask for each keyword
-        for kw in keywords:
-            keyword_lower = kw.lower()
-            mask |= (
-                self.datasets["dataset"].str.lower().str.contains(keyword_lower) |
-                self.datasets["display_name"].str.lower().str.contains(keyword_lower) |
-                self.datasets.get("tags", pd.Series([])).apply(
-                    lambda tags: any(keyword_lower in tag.lower() for tag in tags)
-                )
-            )
+        # Combine all unique keywords into a single escaped regex alternation, so the
+        # search text is scanned once regardless of the number of keywords
+        keywords_lower = dict.fromkeys(kw.lower() for kw in keywords)
+        if keywords_lower:
+            pattern = "|".join(re.escape(kw) for kw in keywords_lower)
+            mask = haystack.str.contains(pattern, regex = True, na = False)
+        else:
+            mask = pd.Series(False, index = self.datasets.index)
         
         # Filtered DataFrame
         filtered_df = self.datasets[mask]
 
-        # Return new DataCatalog instance with filtered df
-        filtered_cat = self.__class__(yaml_path = self.config_file)
+        # Return new DataCatalog instance with filtered df. The instance is created
+        # without calling __init__, so the YAML is not re-read and the dataset
+        # directories are not re-scanned; the configuration is shared with this catalog.
+        filtered_cat = self.__class__.__new__(self.__class__)
+        filtered_cat.config_file = self.config_file
+        filtered_cat.config = self.config
         filtered_cat.datasets = filtered_df.reset_index(drop = True)
-        filtered_cat._df_summary = filtered_df.reset_index(drop = True)
+        filtered_cat._df_summary = filtered_cat.datasets
+        filtered_cat._search_haystack = haystack[mask].reset_index(drop = True)
         
         return filtered_cat
 
+    def _get_search_haystack(self):
+        """
+        Return the lowercased text searched by :meth:`search`, one string per row.
+
+        The dataset name, display name and tags of each row are joined with newlines
+        and lowercased once, then cached on the catalog, so a search is a single
+        vectorised pass over one column.
+
+        Returns
+        -------
+        :class:`pandas.Series`
+            Lowercased, newline-joined ``dataset``, ``display_name`` and ``tags``.
+        """
+
+        df = self._check_lookups()
+
+        if self._search_haystack is None:
+
+            # Non-string names are not searchable (as with .str.lower())
+            self._search_haystack = pd.Series(
+                [
+                    "\n".join([name if isinstance(name, str) else "",
+                               display_name if isinstance(display_name, str) else "",
+                               *tags]).lower()
+                    for name, display_name, tags in zip(df["dataset"], df["display_name"], df["tags"])
+                ],
+                index = df.index,
+                dtype = object,
+            )
+
+        return self._search_haystack
+
     def available_versions(self, dataset):
         """
         Show available versions for a given dataset.
@@ -779,13 +1363,10 @@ class DataCatalog:
             List of available version names.
         """
 
-        # Get dataset Dataframe
-        df = self.datasets
-
-        # Get versions
-        versions = df[df.dataset == dataset]["version"].unique().tolist()
+        # Get versions (from the per-catalog index, copied so callers may modify it)
+        versions = list(self._get_versions_by_dataset().get(dataset, ()))
 
-        if versions == []:
+        if not versions:
             raise ValueError(f"No versions found for dataset '{dataset}'.")
 
         return versions
@@ -810,15 +1391,36 @@ class DataCatalog:
             If no versions are found for the dataset.
         """
 
-        # Get available versions
-        versions = self.available_versions(dataset)
-        
+        # Look up the precomputed latest version
+        latest = self._get_latest_versions().get(dataset)
+
         # Raise error if no versions found
-        if not versions:
-            raise ValueError(f"No versions found for dataset '{dataset}'. All datasets must have at least one version.")
+        if latest is None:
+            raise ValueError(f"No versions found for dataset '{dataset}'.")
+
+        return latest
+
+    def _get_latest_versions(self):
+        """
+        Return a mapping of dataset name to its latest version.
+
+        Built once per catalog on first use from :meth:`_get_versions_by_dataset`.
+        The latest version is the alphanumerically greatest version name.
+
+        Returns
+        -------
+        :class:`dict`
+            Mapping of dataset names to latest version names.
+        """
+
+        self._check_lookups()
 
-        # Return the latest version (sorted alphanumerically)
-        return sorted(versions)[-1]
+        if self._latest_versions is None:
+            self._latest_versions = {
+                name: max(versions) for name, versions in self._get_versions_by_dataset().items()
+            }
+
+        return self._latest_versions
 
     def available_subdatasets(self, dataset, version = None):
         """
@@ -849,21 +1451,15 @@ class DataCatalog:
             If no subdatasets are defined for the specified dataset and version.
         """
         
-        # Get dataset Dataframe
-        df = self.datasets
-
         # If version not specified, get latest version
         if version is None:
             version = self._get_latest_version(dataset)
 
-        # Get subdatasets
-        subdatasets = df[
-            (df.dataset == dataset) &
-            (df.version == version) &
-            (df.subdataset.notnull())
-        ]["subdataset"].unique().tolist()
+        # Get subdatasets from the per-catalog map. Dataset versions without
+        # subdatasets are not in the map. Copied so callers may modify it.
+        subdatasets = list(self._get_subdatasets_by_version().get((dataset, version), []))
 
-        if subdatasets == []:
+        if not subdatasets:
             warnings.warn('No subdatasets defined for this dataset.')
             return
 
@@ -906,23 +1502,20 @@ class DataCatalog:
         if version is None:
             version = self._get_latest_version(dataset)
 
-        # Filter by dataset/version
-        subset = df[
-            (df.dataset == dataset) &
-            (df.version == version)
-        ]
-
-        # Get subdataset if specified
+        # Look up the matching row: the subdataset row if specified, otherwise
+        # the first row of the dataset/version
         if subdataset is not None:
-            subset = subset[subset.subdataset == subdataset]
+            position = self._get_subdataset_index().get((dataset, version, subdataset))
+        else:
+            positions = self._get_row_index().get((dataset, version))
+            position = positions[0] if positions else None
 
         # Raise error if no matching entry found
-        if subset.empty:
+        if position is None:
             raise KeyError(f"No dataset entry found for: {dataset}, {version} ({subdataset})")
 
-        # Get resolutions from the single matching row
-        row = subset.iloc[0]
-        resolutions = row.get("resolutions", None)
+        # Get resolutions from the matching row (single cell, no row Series)
+        resolutions = df["resolutions"].iat[position]
         
         # Warn if no resolutions defined
         if resolutions is None:
@@ -961,13 +1554,7 @@ class DataCatalog:
         before attempting to load data, preventing confusing errors downstream.
         """
 
-        CATALOG_KEYWORDS = {
-            "resolution",
-            "static",
-            "subdataset"
-        }
-
-        used = set(kwargs.keys()) & CATALOG_KEYWORDS
+        used = self._CATALOG_KEYWORDS.intersection(kwargs)
 
         # Check resolution
         if "resolution" in used:
@@ -1036,82 +1623,153 @@ class DataCatalog:
         # Get dataset Dataframe
         df = self.datasets
 
+        # Versions of each dataset (precomputed per catalog)
+        versions_by_dataset = self._get_versions_by_dataset()
+
+        # Output is collected and printed once at each exit point
+        lines = []
+
         # 1. If no dataset specified, simply list datasets
         # ------------------------------------------------------------------
         if dataset is None:
-            datasets = sorted(df.dataset.unique())
-            print("Available datasets:")
-            for d in datasets:
-                print(f"  - {d}")
+            lines.append("Available datasets:")
+            lines.extend(f"  - {d}" for d in sorted(versions_by_dataset))
+            print("\n".join(lines))
             return
 
         # 2. Dataset-level help - list versions
         # ------------------------------------------------------------------
-        subset = df[df.dataset == dataset]
-
-        if subset.empty:
+        if dataset not in versions_by_dataset:
             raise KeyError(f"Unknown dataset '{dataset}'")
 
-        print(f"Dataset: {dataset}")
+        lines.append(f"Dataset: {dataset}")
 
-        versions = sorted(subset.version.unique())
-        print("\nAvailable versions:")
-        for v in versions:
-            print(f"  - {v}")
+        versions = sorted(versions_by_dataset[dataset])
+        lines.append("\nAvailable versions:")
+        lines.extend(f"  - {v}" for v in versions)
 
         # If no version specified, stop here
         if version is None:
-            print("\nTip:")
-            print("  Use catalog.help(dataset=..., version=...) for more details.")
+            lines.append("\nTip:")
+            lines.append("  Use catalog.help(dataset=..., version=...) for more details.")
+            print("\n".join(lines))
             return
 
         # 3. Version-level help
         # ------------------------------------------------------------------
-        subset = subset[subset.version == version]
+        positions = self._get_row_index().get((dataset, version))
 
-        if subset.empty:
+        if not positions:
+            print("\n".join(lines))
             raise KeyError(
                 f"Version '{version}' not found for dataset '{dataset}'. "
                 f"Available versions: {versions}"
             )
 
-        print(f"\nVersion: {version}")
+        subset = df.iloc[positions]
+        has_sub = bool(subset["subdataset"].notna().any())
+
+        lines.append(f"\nVersion: {version}")
 
         # 4. Subdatasets
         # ------------------------------------------------------------------
         # If subdatasets exist, list them
-        if not subset.subdataset.isna().all():
-            subdatasets = sorted(subset.subdataset.dropna().unique())
-            print("\nAvailable subdatasets:")
-            for s in subdatasets:
-                print(f"  - {s}")
+        if has_sub:
+            subdatasets = sorted(dict.fromkeys(subset.subdataset.dropna().tolist()))
+            lines.append("\nAvailable subdatasets:")
+            lines.extend(f"  - {s}" for s in subdatasets)
         else:
-            print("\nAvailable subdatasets: none")
+            lines.append("\nAvailable subdatasets: none")
 
         # 5. Capabilities (based on row metadata)
         # ------------------------------------------------------------------
-        row = subset.iloc[0]
+        resolutions = subset["resolutions"].iat[0]
+        static_patterns = subset["static_patterns"].iat[0]
 
-        print("\nSupported catalog keywords:")
-        print(f"  - subdataset : {'yes' if not subset.subdataset.isna().all() else 'no'}")
-        print(f"  - resolution : {'yes' if row.resolutions is not None else 'no'}")
-        print(f"  - static  : {'yes' if bool(row.static_patterns) else 'no'}")
+        lines.append("\nSupported catalog keywords:")
+        lines.append(f"  - subdataset : {'yes' if has_sub else 'no'}")
+        lines.append(f"  - resolution : {'yes' if resolutions is not None else 'no'}")
+        lines.append(f"  - static  : {'yes' if bool(static_patterns) else 'no'}")
 
         # 6. Example usage
         # ------------------------------------------------------------------
-        print("\nExample usage:")
+        lines.append("\nExample usage:")
+
+        example = [f"catalog.load_dataset('{dataset}', version = '{version}'"]
+
+        if has_sub:
+            example.append(", subdataset = '...'")
+
+        if resolutions is not None:
+            example.append(", resolution = '...'")
+
+        if static_patterns:
+            example.append(", static = True")
+
+        example.append(")")
 
-        example = f"catalog.load_dataset('{dataset}', version = '{version}'"
+        lines.append(f"  {''.join(example)}")
+        print("\n".join(lines))
 
-        if not subset.subdataset.isna().all():
-            example += ", subdataset = '...'"
 
-        if row.resolutions is not None:
-            example += ", resolution = '...'"
+@functools.lru_cache(maxsize = 8)
+def _get_catalog_cached(yaml_path, mtime_ns, size):
+    """
+    Construct a :class:`DataCatalog`, memoized per YAML path and file state.
+
+    ``mtime_ns`` and ``size`` are only used as part of the cache key, so that
+    editing the YAML file yields a freshly built catalog. A ``yaml_path`` of ``None``
+    builds the default packaged catalog.
+    """
+
+    return DataCatalog(yaml_path = yaml_path)
+
+def get_catalog(yaml_path = None):
+    """
+    Return a shared :class:`DataCatalog` for a YAML configuration file.
+
+    Constructing a :class:`DataCatalog` parses the YAML file and scans the dataset
+    directories. This function caches the constructed catalog per resolved YAML path,
+    so repeated calls (e.g. from several notebook cells or entry points) reuse the
+    same object. The cached catalog is rebuilt when the YAML file (including the
+    default packaged one) is modified, or after :meth:`DataCatalog.clear_cache` is called.
+
+    The returned catalog is a mutable singleton shared by every caller that requests
+    the same configuration: changes made to it (e.g. assigning ``datasets``) are seen
+    by all of them. Construct a :class:`DataCatalog` directly, or use :meth:`DataCatalog.search`
+    (which returns a new catalog), when an independent instance is needed.
+
+    Parameters
+    ----------
+    yaml_path : :class:`pathlib.Path` or :class:`str`, optional
+        Path to the YAML configuration file. If not provided, the default packaged
+        configuration file is used. Default is ``None``.
+
+    Returns
+    -------
+    :class:`DataCatalog`
+        The shared catalog instance. It should not be modified in place, as
+        changes are visible to every other caller.
+
+    Examples
+    --------
+    >>> from ccdtools.catalog import get_catalog
+    >>> catalog = get_catalog()
+    >>> catalog is get_catalog()
+    True
+    """
 
-        if row.static_patterns:
-            example += ", static = True"
+    # The default packaged catalog is keyed on None plus the packaged file's state
+    if yaml_path is None:
+        st = os.stat(_default_config_path())
+        return _get_catalog_cached(None, st.st_mtime_ns, st.st_size)
 
-        example += ")"
+    # Normalise the path and key on the file state for cache-key stability
+    yaml_path = os.path.realpath(os.fspath(yaml_path))
+    try:
+        st = os.stat(yaml_path)
+    except FileNotFoundError:
+        # Let DataCatalog raise its usual error
+        return DataCatalog(yaml_path = yaml_path)
 
-        print(f"  {example}")
+    return _get_catalog_cached(yaml_path, st.st_mtime_ns, st.st_size)
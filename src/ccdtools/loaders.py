@@ -4,19 +4,35 @@ Default and custom loader functions for datasets contained within the catalog
 
 import pandas as pd
 import xarray as xr
-import geopandas as gpd 
 import numpy as np
-import rioxarray as rxr
 import os
-from datetime import datetime
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+# Four-digit years (1900-2099) as encoded in dataset filenames
+_YEAR_RE = re.compile(r'(19\d{2}|20\d{2})')
+
+# xr.open_mfdataset keywords that only apply when combining multiple files
+_MFDATASET_KWARGS = frozenset({
+    "concat_dim",
+    "compat",
+    "preprocess",
+    "data_vars",
+    "coords",
+    "join",
+    "attrs_file",
+    "combine_attrs",
+})
+
+# Variables dropped from each RACMO file before combining
+_RACMO_DROP_VARS = frozenset({"block1", "block2"})
 
 def default(self, row, resolution = None, static = True, **kwargs):
     """
     Default loader function to load data based on file extension.
 
-    Load data from various file formats (CSV, GeoPackage, Shapefile, GeoTIFF, NetCDF)
+    Load data from various file formats (CSV, GeoPackage, Shapefile, GeoTIFF, NetCDF, Zarr)
     and return the appropriate data structure.
 
     Parameters
@@ -35,6 +51,16 @@ def default(self, row, resolution = None, static = True, **kwargs):
     **kwargs : dict
         Additional keyword arguments passed to the underlying loading functions
         (e.g., pd.read_csv, gpd.read_file, rxr.open_rasterio, xr.open_mfdataset).
+        Zarr stores are opened with ``engine = 'zarr'`` (requires zarr).
+        For CSVs, ``engine = 'pyarrow'`` selects pandas' multithreaded pyarrow parser
+        (requires pyarrow). For CSVs, ``max_workers`` caps the number of files read
+        concurrently (default 8). GeoPackage and Shapefile files are read concurrently
+        (also capped by ``max_workers``) only with ``engine = 'pyogrio'``, passed here or
+        set in ``geopandas.options.io_engine``; otherwise they are read one at a time.
+        For CSVs, ``downcast = True`` shrinks numeric columns to the smallest dtype that
+        holds their values and converts low-cardinality string columns to ``category``;
+        pass ``dtype = {...}`` instead to skip type inference entirely when the column
+        types are known.
 
     Returns
     -------
@@ -45,6 +71,7 @@ def default(self, row, resolution = None, static = True, **kwargs):
         - 'gpkg' or 'shp': :class:`geopandas.GeoDataFrame`
         - 'tif': :class:`xarray.Dataset`
         - 'nc': :class:`xarray.Dataset`
+        - 'zarr': :class:`xarray.Dataset`
 
     Raises
     ------
@@ -87,79 +114,187 @@ def default(self, row, resolution = None, static = True, **kwargs):
     # CSV -> Pandas
     if ext == "csv":
 
-        # Get kwargs (or set defaults)
-        low_memory = kwargs.pop("low_memory", False)
+        # Get kwargs (or set defaults). low_memory only applies to the C parser, so it is
+        # not passed when the multithreaded pyarrow engine is requested (engine = "pyarrow").
+        max_workers = kwargs.pop("max_workers", 8)
+        downcast = kwargs.pop("downcast", False)
+        if kwargs.get("engine") != "pyarrow":
+            kwargs.setdefault("low_memory", False)
+
         
-        # Load each CSV into a DataFrame and append to data_list
-        data_list = []
-        for f in files:
-            data = pd.read_csv(f, skiprows = skip_lines, low_memory = low_memory, **kwargs)
-            data_list.append(data)
+        # Load each CSV into a DataFrame. The C parser releases the GIL, so files are
+        # read concurrently; map() keeps the file order for the concatenation.
+        with ThreadPoolExecutor(max_workers = min(max_workers, len(files))) as pool:
+            data_list = list(pool.map(lambda f: pd.read_csv(f, skiprows = skip_lines, **kwargs), files))
         
         # Concatenate all CSVs into a single DataFrame
         output = pd.concat(data_list, ignore_index = True)
 
-        # Replace no_data values with NaN if specified
+        # Replace no_data values with NaN if specified. This is done after parsing rather
+        # than with na_values, so that text columns (e.g. IDs or flags) are left as read.
         if no_data is not None:
-            output = output.replace(no_data, np.nan)
+            output = _mask_no_data(output, no_data)
+
+        # Optionally shrink dtypes to reduce memory
+        if downcast:
+            output = _downcast_dtypes(output)
 
         return output 
 
     # GPKG / SHP -> GeoPandas
     if ext in ("gpkg", "shp"):
+
+        # Imported on demand: geopandas pulls in GDAL/shapely/pyproj
+        import geopandas as gpd
+
+        # Get kwargs (or set defaults)
+        max_workers = kwargs.pop("max_workers", 8)
+        engine = kwargs.pop("engine", None) or gpd.options.io_engine
+        read_kwargs = {"engine": engine} if engine is not None else {}
+
+        # Load each file into a GeoDataFrame. Only the pyogrio engine is safe for concurrent
+        # opens (each call opens its own GDAL dataset and releases the GIL), so files are
+        # read concurrently with it; map() keeps the file order for the concatenation.
+        # fiona, which older geopandas versions use by default, reads one file at a time.
+        if engine == "pyogrio":
+            with ThreadPoolExecutor(max_workers = min(max_workers, len(files))) as pool:
+                data_list = list(pool.map(lambda f: gpd.read_file(f, **read_kwargs), files))
+        else:
+            data_list = [gpd.read_file(f, **read_kwargs) for f in files]
         
-        # Load each file into a GeoDataFrame and append to data_list
-        data_list = []
-        for f in files:
-            data = gpd.read_file(f)
-            data_list.append(data)
-        
-        # Concatenate all GeoDataFrames into a single GeoDataFrame
-        output = gpd.GeoDataFrame(pd.concat(data_list, ignore_index = True))
+        # Concatenate all GeoDataFrames into a single GeoDataFrame. A single file is
+        # already a GeoDataFrame with a default index, so the copy is skipped.
+        if len(data_list) == 1:
+            output = data_list[0]
+        else:
+            output = gpd.GeoDataFrame(pd.concat(data_list, ignore_index = True))
 
         # Replace no_data values with NaN if specified
         if no_data is not None:
-            output = output.replace(no_data, np.nan)
+            output = _mask_no_data(output, no_data)
 
         return output
 
     # TIF -> rioxarray / xarray
     if ext in ("tif"):
 
+        # Imported on demand: rioxarray pulls in rasterio/GDAL
+        import rioxarray as rxr
+
         # Get kwargs (or set defaults)
         masked = kwargs.pop("masked", True)
         
-        # Load each TIF into an xarray DataArray and store in a dict. Using masked = True automates handling of NaN values.
-        data_dict = {}
-        for f in files:
-            name = f.stem
+        def open_tif(f):
             data = rxr.open_rasterio(f, masked = masked)
 
             # Squeeze out single-size 'band' dimension if present
             if "band" in data.dims and data.band.size == 1:
                 data = data.squeeze("band", drop = True)
 
-            # Store in dict
-            data_dict[name] = data
+            return f.stem, data
+
+        # Load each TIF into an xarray DataArray and store in a dict. Using masked = True automates handling of NaN values.
+        # Files are opened concurrently (GDAL releases the GIL during reads); map() keeps the file order.
+        with ThreadPoolExecutor(max_workers = min(32, len(files))) as pool:
+            data_dict = dict(pool.map(open_tif, files))
 
         # Combine all DataArrays into a single Dataset
         output = xr.Dataset(data_dict)
 
         return output
 
-    # NetCDF -> xarray
-    if ext in ("nc"):
+    # NetCDF / Zarr -> xarray
+    if ext in ("nc", "zarr"):
 
         # Get kwargs (or set defaults)
+        if ext == "zarr":
+            kwargs.setdefault("engine", "zarr")
         combine = kwargs.pop("combine", "by_coords")
+        parallel = kwargs.pop("parallel", True)
+
+        # Keep reads lazy with dask chunks sized automatically, so large variables
+        # are split into manageable pieces rather than one chunk per file
+        chunks = kwargs.pop("chunks", "auto")
+
+        # Single file: open it directly and skip the multi-file combine machinery.
+        if len(files) == 1 and _MFDATASET_KWARGS.isdisjoint(kwargs):
+            return xr.open_dataset(files[0], chunks = chunks, **kwargs)
 
+        # Open files concurrently (via dask) as in the custom NetCDF loaders
         output = xr.open_mfdataset(files,
                                     combine = combine,
+                                    parallel = parallel,
+                                    chunks = chunks,
                                     **kwargs)
 
         return output
 
-    raise ValueError(f"Extension '{ext}' is currently not supported for loading. Use one of: csv, gpkg, shp, tif, nc.")
+    raise ValueError(f"Extension '{ext}' is currently not supported for loading. Use one of: csv, gpkg, shp, tif, nc, zarr.")
+
+
+def _mask_no_data(output, no_data):
+    """
+    Replace a no-data sentinel with NaN in a (Geo)DataFrame.
+
+    Numeric sentinels are only compared against numeric columns, so string, object and
+    geometry columns are not scanned. Other sentinels fall back to
+    :meth:`pandas.DataFrame.replace` over the whole frame.
+
+    Parameters
+    ----------
+    output : :class:`pandas.DataFrame` or :class:`geopandas.GeoDataFrame`
+        Loaded data.
+    no_data : Any
+        Value representing missing data.
+
+    Returns
+    -------
+    :class:`pandas.DataFrame` or :class:`geopandas.GeoDataFrame`
+        Data with ``no_data`` values replaced by NaN.
+    """
+
+    if isinstance(no_data, bool) or not isinstance(no_data, (int, float, np.number)):
+        return output.replace(no_data, np.nan)
+
+    numeric = output.select_dtypes(include = "number").columns
+    if len(numeric):
+        output[numeric] = output[numeric].mask(output[numeric] == no_data)
+
+    return output
+
+
+def _downcast_dtypes(output):
+    """
+    Downcast the columns of a DataFrame to smaller dtypes where the values allow.
+
+    Integer and float columns are downcast with :func:`pandas.to_numeric`, and text
+    columns (``object`` or pandas string dtype) whose unique values make up less than
+    half of the rows are converted to ``category``.
+
+    Parameters
+    ----------
+    output : :class:`pandas.DataFrame`
+        Loaded data.
+
+    Returns
+    -------
+    :class:`pandas.DataFrame`
+        Data with downcast column dtypes.
+    """
+
+    for col in output.select_dtypes(include = "integer").columns:
+        output[col] = pd.to_numeric(output[col], downcast = "integer")
+
+    for col in output.select_dtypes(include = "float").columns:
+        output[col] = pd.to_numeric(output[col], downcast = "float")
+
+    n_rows = len(output)
+    # Text columns are 'object' or, from pandas 3, the dedicated string dtype
+    for col in output.select_dtypes(include = ["object", "string"]).columns:
+        if n_rows and output[col].nunique() / n_rows < 0.5:
+            output[col] = output[col].astype("category")
+
+    return output
 
 
 def _extract_year_range_from_filename(filename):
@@ -195,18 +330,19 @@ def _extract_year_range_from_filename(filename):
     (2015, 2015)
     """
 
-    # Use regex to find all four-digit year patterns in the filename
+    # Use regex to find all four-digit year patterns in the filename. Only the base name
+    # is searched, as parent directories may themselves contain years.
     base_name = os.path.basename(filename)
-    years = re.findall(r'(19\d{2}|20\d{2})', base_name)
-    years = [int(y) for y in years]
+    years = [int(y) for y in _YEAR_RE.findall(base_name)]
 
     # If no years found, raise an error
     if not years:
         raise ValueError(f"No years found in filename: {filename}")
 
-    # Return the first and last years found
-    years = sorted(set(years))
-    return years[0], years[-1]
+    # Return the earliest and latest years found
+    if len(years) == 1:
+        return years[0], years[0]
+    return min(years), max(years)
 
 def _filter_resolution_files(files, resolution = None, static = None, static_patterns = None, resolutions = None):
     """
@@ -276,16 +412,19 @@ def _filter_resolution_files(files, resolution = None, static = None, static_pat
             "define any static patterns."
         )
 
-    # Ensure static_patterns is a list
-    static_patterns = static_patterns or []
-
-    # Isolate static or annual files
-    if static:
-        # Get only static files
-        files = [f for f in files if any(pattern in f.name for pattern in static_patterns)]
+    # Isolate static or annual files. All static patterns are matched with a single
+    # compiled alternation per file name.
+    if static_patterns:
+        is_static = re.compile("|".join(map(re.escape, static_patterns))).search
+        if static:
+            # Get only static files
+            files = [f for f in files if is_static(f.name)]
+        else:
+            # Get only annual files (Exclude static patterns)
+            files = [f for f in files if not is_static(f.name)]
     else:
-        # Get only annual files (Exclude static patterns)
-        files = [f for f in files if not any(pattern in f.name for pattern in static_patterns)]
+        # No static patterns: every file is an annual file
+        files = list(files)
 
     # Filter by resolution if specified
     if resolution is not None:
@@ -346,6 +485,8 @@ def measures_velocity(self, row, resolution = None, static = None, **kwargs):
         - For annual files, the time dimension is set to July 2nd of the middle year (or the single year if only one is present).
         - Assumes the filename is stored in ``ds.encoding['source']``.
         - Uses parallel loading via ``xr.open_mfdataset``.
+        - Default merge behavior: ``data_vars = 'minimal'``, ``coords = 'minimal'``,
+          ``compat = 'override'``, which assumes all files share the same variables.
 
     Examples
     --------
@@ -380,11 +521,12 @@ def measures_velocity(self, row, resolution = None, static = None, **kwargs):
         start_year, end_year = _extract_year_range_from_filename(ds.encoding['source'])
         mid_year = start_year + (end_year - start_year) // 2
         
-        # Create time dimension (July 2nd of the extracted year)
-        time_da = xr.DataArray([datetime(year = mid_year, month = 7,  day = 2)], dims = 'time')
+        # Create time dimension (July 2nd of the extracted year). Building the datetime64
+        # array directly avoids an intermediate DataArray and datetime conversion per file.
+        time = np.array([f"{mid_year:04d}-07-02"], dtype = "datetime64[ns]")
 
         # Expand dataset to include time dimension
-        return ds.expand_dims(time = time_da)
+        return ds.expand_dims(time = time)
 
     # Extract parameters from row
     path, ext, skip_lines, no_data, ignore_dirs, ignore_files, loader, resolutions, static_patterns = self._extract_row_params(row)
@@ -412,8 +554,16 @@ def measures_velocity(self, row, resolution = None, static = None, **kwargs):
             f"No files found with extension '{ext}' in {path}"
         )
 
-    # Get kwargs (or set defaults)
+    # Get kwargs (or set defaults). All files of a MEaSUREs product share one schema, so
+    # only variables along the concatenation dimension are concatenated and the rest are
+    # taken from the first file without comparing them across files.
     combine = kwargs.pop("combine", "by_coords")
+    data_vars = kwargs.pop("data_vars", "minimal")
+    coords = kwargs.pop("coords", "minimal")
+    compat = kwargs.pop("compat", "override")
+
+    # Keep reads lazy with automatically sized dask chunks, as in the default loader
+    chunks = kwargs.pop("chunks", "auto")
 
     # Only use preprocessor for annual mode (no time dimension needed in static files)
     preprocess_func = _preprocessor if not static else None
@@ -421,6 +571,10 @@ def measures_velocity(self, row, resolution = None, static = None, **kwargs):
     # Load NetCDF files with preprocessing (if necessary)
     output = xr.open_mfdataset(files,
                             combine = combine,
+                            data_vars = data_vars,
+                            coords = coords,
+                            compat = compat,
+                            chunks = chunks,
                             preprocess = preprocess_func,
                             parallel = True,
                             **kwargs)
@@ -485,12 +639,15 @@ def racmo(self, row, **kwargs):
             The preprocessed dataset with unnecessary variables dropped and 
             coordinates set for 'rlat' and 'rlon'.
         """
-        
-        DROP_VARS = {"block1", "block2"}
 
         ds = ds.set_coords(["rlat", "rlon"])
 
-        return ds.drop_vars(DROP_VARS & set(ds.variables))
+        # Only drop the variables present in this file, skipping the copy if there are none
+        drop_vars = [name for name in _RACMO_DROP_VARS if name in ds.variables]
+        if not drop_vars:
+            return ds
+
+        return ds.drop_vars(drop_vars)
 
     # Extract parameters from row
     path, ext, skip_lines, no_data, ignore_dirs, ignore_files, loader, resolutions, static_patterns = self._extract_row_params(row)
@@ -515,12 +672,16 @@ def racmo(self, row, **kwargs):
     compat = kwargs.pop("compat", "override")
     combine_attrs = kwargs.pop("combine_attrs", "drop_conflicts")
 
+    # Keep reads lazy with automatically sized dask chunks, as in the default loader
+    chunks = kwargs.pop("chunks", "auto")
+
     # Load NetCDF files with preprocessing (if necessary)
     output = xr.open_mfdataset(files,
                             combine = combine,
                             join = join,
                             compat = compat,
                             combine_attrs = combine_attrs,
+                            chunks = chunks,
                             preprocess = _preprocessor,
                             parallel = True,
                             **kwargs)
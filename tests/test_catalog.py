@@ -0,0 +1,239 @@
+import os
+
+import pytest
+
+from ccdtools.catalog import DataCatalog
+
+
+@pytest.fixture
+def catalog_root(tmp_path):
+    """Dataset tree and YAML configuration with two CSV datasets."""
+
+    for relpath, value in [("a/v1/x.csv", 1), ("a/v2/y.csv", 2), ("b/v1/z.csv", 3)]:
+        path = tmp_path / relpath
+        path.parent.mkdir(parents = True, exist_ok = True)
+        path.write_text(f"x\n{value}\n")
+
+    yaml_path = tmp_path / "catalog.yaml"
+    yaml_path.write_text(
+        "datasets:\n"
+        "  a:\n"
+        f"    path: {tmp_path / 'a'}\n"
+        "    extension: csv\n"
+        "  b:\n"
+        f"    path: {tmp_path / 'b'}\n"
+        "    extension: csv\n"
+    )
+
+    yield tmp_path
+
+    DataCatalog.clear_cache()
+
+
+def test_lookups_follow_in_place_row_changes(catalog_root):
+    catalog = DataCatalog(catalog_root / "catalog.yaml")
+    assert catalog.load_dataset("a", version = "v1")["x"].tolist() == [1]
+
+    # Reordering rows in place must not leave the row index pointing at old positions
+    catalog.datasets.sort_values("dataset", ascending = False, inplace = True)
+    assert catalog.load_dataset("a", version = "v1")["x"].tolist() == [1]
+    assert catalog.load_dataset("b", version = "v1")["x"].tolist() == [3]
+
+    # Dropping rows in place removes them from the lookups
+    catalog.datasets.drop(index = catalog.datasets.index[catalog.datasets["dataset"] == "a"], inplace = True)
+    assert catalog.load_dataset("b", version = "v1")["x"].tolist() == [3]
+    with pytest.raises(KeyError):
+        catalog.load_dataset("a", version = "v1")
+
+
+def test_clear_cache_picks_up_replaced_loader(catalog_root, monkeypatch):
+    from ccdtools import loaders
+
+    catalog = DataCatalog(catalog_root / "catalog.yaml")
+    original = catalog._get_loader("default")
+    assert original is loaders.default
+
+    # The memoized loader is kept until the caches are cleared
+    def replacement(self, row, **kwargs):
+        return "replaced"
+
+    monkeypatch.setattr(loaders, "default", replacement)
+    assert catalog._get_loader("default") is original
+
+    DataCatalog.clear_cache()
+    assert catalog.load_dataset("a", version = "v1") == "replaced"
+
+
+def test_ignore_patterns_match_posix_paths(monkeypatch):
+    import os
+
+    from ccdtools.catalog import _ignore_matcher
+
+    # Simulate Windows separators: patterns written with '/' must still match
+    monkeypatch.setattr(os, "sep", "\\")
+    ignored = _ignore_matcher(("v1/skip",))
+
+    assert ignored("C:\\data\\v1\\skip\\x.nc")
+    assert not ignored("C:\\data\\v1\\keep\\x.nc")
+
+
+def _names(paths):
+    return [p.name for p in paths]
+
+
+def test_file_list_cache_follows_nested_changes(tmp_path):
+    from ccdtools.catalog import _find_files
+
+    nested = tmp_path / "v1" / "sub"
+    nested.mkdir(parents = True)
+    (tmp_path / "v1" / "a.csv").write_text("x\n1\n")
+    (nested / "b.csv").write_text("x\n2\n")
+
+    def find():
+        return _names(_find_files(str(tmp_path), ".csv", (), (), False))
+
+    assert find() == ["a.csv", "b.csv"]
+
+    # Added in a nested directory
+    (nested / "c.csv").write_text("x\n3\n")
+    assert find() == ["a.csv", "b.csv", "c.csv"]
+
+    # Removed from a nested directory
+    (nested / "b.csv").unlink()
+    assert find() == ["a.csv", "c.csv"]
+
+    # Renamed in a nested directory
+    (nested / "c.csv").rename(nested / "d.csv")
+    assert find() == ["a.csv", "d.csv"]
+
+    # Modified contents do not change the file list
+    (nested / "d.csv").write_text("x\n4\n")
+    assert find() == ["a.csv", "d.csv"]
+
+    # A new nested directory and the files added to it
+    (nested / "deep").mkdir()
+    (nested / "deep" / "e.csv").write_text("x\n5\n")
+    assert find() == ["a.csv", "d.csv", "e.csv"]
+
+
+def test_versions_follow_new_version_directories(catalog_root):
+    assert DataCatalog(catalog_root / "catalog.yaml").available_versions("a") == ["v1", "v2"]
+
+    (catalog_root / "a" / "v3").mkdir()
+    assert DataCatalog(catalog_root / "catalog.yaml").available_versions("a") == ["v1", "v2", "v3"]
+
+
+def test_get_catalog_rebuilds_after_yaml_edit(catalog_root):
+    from ccdtools.catalog import get_catalog
+
+    yaml_path = catalog_root / "catalog.yaml"
+    catalog = get_catalog(yaml_path)
+    assert get_catalog(str(yaml_path)) is catalog
+
+    # Editing the YAML changes its size and modification time
+    with open(yaml_path, "a") as f:
+        f.write("# edited\n")
+
+    rebuilt = get_catalog(yaml_path)
+    assert rebuilt is not catalog
+    assert get_catalog(yaml_path) is rebuilt
+
+
+def test_clear_cache(catalog_root):
+    from ccdtools import catalog as catalog_module
+
+    yaml_path = catalog_root / "catalog.yaml"
+    catalog = catalog_module.get_catalog(yaml_path)
+    catalog.load_dataset("a", version = "v1")
+    assert catalog_module._FILE_LISTS
+    assert catalog_module._read_yaml_config.cache_info().currsize
+
+    DataCatalog.clear_cache()
+
+    assert not catalog_module._FILE_LISTS
+    assert catalog_module._read_yaml_config.cache_info().currsize == 0
+    assert catalog_module._list_subdirectories.cache_info().currsize == 0
+    assert catalog_module.get_catalog(yaml_path) is not catalog
+
+
+def test_walk_files_prunes_ignored_dirs_and_matches_zarr_stores(tmp_path):
+    from ccdtools.catalog import _walk_files
+
+    for relpath in ["v1/a.nc", "v1/skip/b.nc", "v1/skip/deep/c.nc", "v1/bad_d.nc"]:
+        path = tmp_path / relpath
+        path.parent.mkdir(parents = True, exist_ok = True)
+        path.write_text("")
+
+    visited = []
+    found = _walk_files(str(tmp_path), ".nc", ignore_dirs = ("skip",), ignore_files = ("bad_",), visited = visited)
+    assert sorted(os.path.basename(p) for p in found) == ["a.nc"]
+
+    # Ignored directories are pruned without being listed
+    assert not any("skip" in directory for directory, _ in visited)
+
+    # Zarr stores are directories: they are matched and not descended into
+    (tmp_path / "v1" / "store.zarr" / "var").mkdir(parents = True)
+    (tmp_path / "v1" / "store.zarr" / ".zmetadata").write_text("{}")
+    (tmp_path / "v1" / "skip" / "other.zarr").mkdir()
+
+    found = _walk_files(str(tmp_path), ".zarr", ignore_dirs = ("skip",), match_dirs = True)
+    assert [os.path.basename(p) for p in found] == ["store.zarr"]
+    assert list(_walk_files(str(tmp_path), ".zarr")) == []
+
+
+@pytest.fixture
+def search_catalog(tmp_path):
+    """Catalog whose names and tags contain regex metacharacters."""
+
+    for name in ("alpha", "beta", "gamma"):
+        (tmp_path / name / "v1").mkdir(parents = True)
+
+    yaml_path = tmp_path / "catalog.yaml"
+    yaml_path.write_text(
+        "datasets:\n"
+        "  alpha:\n"
+        "    display_name: Ice (v2)+\n"
+        f"    path: {tmp_path / 'alpha'}\n"
+        "    extension: nc\n"
+        "    tags: [bed, Temperature]\n"
+        "  beta:\n"
+        "    display_name: Ice v2\n"
+        f"    path: {tmp_path / 'beta'}\n"
+        "    extension: nc\n"
+        "    tags: [ocean]\n"
+        "  gamma:\n"
+        "    display_name: Snow.Depth\n"
+        f"    path: {tmp_path / 'gamma'}\n"
+        "    extension: nc\n"
+        "    tags: [temperature]\n"
+    )
+
+    yield DataCatalog(yaml_path)
+
+    DataCatalog.clear_cache()
+
+
+def test_search_escapes_keywords(search_catalog):
+    # Metacharacters are matched literally, not as a pattern
+    assert search_catalog.search("(v2)+").datasets["dataset"].tolist() == ["alpha"]
+    assert search_catalog.search("w.d").datasets["dataset"].tolist() == ["gamma"]
+    assert search_catalog.search("e.v").datasets["dataset"].tolist() == []
+
+    # Multiple keywords match any of them, case-insensitively
+    assert search_catalog.search(["OCEAN", "snow.depth"]).datasets["dataset"].tolist() == ["beta", "gamma"]
+    assert search_catalog.search([]).datasets.empty
+
+
+def test_chained_search_reuses_inherited_haystack(search_catalog):
+    filtered = search_catalog.search("temperature")
+    assert filtered.datasets["dataset"].tolist() == ["alpha", "gamma"]
+
+    # The filtered catalog carries the matching rows of the parent's search text
+    haystack = filtered._search_haystack
+    assert haystack is not None
+    assert haystack.tolist() == search_catalog._get_search_haystack()[[0, 2]].tolist()
+
+    chained = filtered.search("ice")
+    assert filtered._search_haystack is haystack
+    assert chained.datasets["dataset"].tolist() == ["alpha"]
+    assert chained.datasets.index.tolist() == [0]
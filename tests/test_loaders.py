@@ -0,0 +1,50 @@
+import pandas as pd
+
+from ccdtools.loaders import _downcast_dtypes
+
+
+def test_downcast_dtypes_numeric():
+    df = pd.DataFrame({"i": [1, 2, 3, 4], "f": [1.5, 2.0, None, 4.0]})
+
+    output = _downcast_dtypes(df)
+
+    assert output["i"].dtype == "int8"
+    assert output["f"].dtype == "float32"
+
+
+def test_downcast_dtypes_text_to_category():
+    df = pd.DataFrame({
+        "default": ["a", "a", "a", "a", "b"],
+        "object": pd.Series(["a", "a", "a", "a", "b"], dtype = object),
+        "string": pd.Series(["a", "a", "a", "a", "b"], dtype = "string"),
+        "unique": ["a", "b", "c", "d", "e"],
+    })
+
+    output = _downcast_dtypes(df)
+
+    assert isinstance(output["default"].dtype, pd.CategoricalDtype)
+    assert isinstance(output["object"].dtype, pd.CategoricalDtype)
+    assert isinstance(output["string"].dtype, pd.CategoricalDtype)
+    assert not isinstance(output["unique"].dtype, pd.CategoricalDtype)
+
+
+def test_default_csv_masks_no_data_in_numeric_columns_only(tmp_path):
+    from ccdtools.catalog import DataCatalog
+
+    data = tmp_path / "d" / "v1"
+    data.mkdir(parents = True)
+    (data / "x.csv").write_text("value,flag\n-9999,-9999\n2,ok\n")
+
+    yaml_path = tmp_path / "catalog.yaml"
+    yaml_path.write_text(
+        "datasets:\n"
+        "  d:\n"
+        f"    path: {tmp_path / 'd'}\n"
+        "    extension: csv\n"
+        "    no_data_value: -9999\n"
+    )
+
+    output = DataCatalog(yaml_path).load_dataset("d", version = "v1")
+
+    assert output["value"].isna().tolist() == [True, False]
+    assert output["flag"].tolist() == ["-9999", "ok"]